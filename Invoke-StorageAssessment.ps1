@@ -44,6 +44,10 @@
 .PARAMETER AllSubscriptions
     Assess all enabled subscriptions (requires appropriate permissions)
 
+.PARAMETER ThrottleLimit
+    Number of storage accounts to assess concurrently. Default: 1 (serial).
+    Values above 1 use parallel runspaces; per-account console output may interleave.
+
 .PARAMETER Verbose
     Enable detailed logging
 
@@ -94,7 +98,11 @@ param(
     [switch]$Quick,
     
     [Parameter(Mandatory = $false)]
-    [switch]$AllSubscriptions
+    [switch]$AllSubscriptions,
+
+    [Parameter(Mandatory = $false)]
+    [ValidateRange(1, 32)]
+    [int]$ThrottleLimit = 1
 )
 
 #region Script Variables
@@ -108,7 +116,7 @@ $Script:AssessmentResults = @{
         Version = "2.0.0"
         Repository = "https://github.com/mobieus10036/azure-storage-analyzer"
     }
-    StorageAccounts = @()
+    StorageAccounts = [System.Collections.Generic.List[object]]::new()
     Summary = @{
         TotalAccounts = 0
         TotalFindings = 0
@@ -205,29 +213,6 @@ function Write-Finding {
     Write-Host $Message -ForegroundColor Gray
 }
 
-function Write-ProgressBar {
-    [CmdletBinding()]
-    param(
-        [Parameter(Mandatory = $true)]
-        [int]$Current,
-        
-        [Parameter(Mandatory = $true)]
-        [int]$Total,
-        
-        [Parameter(Mandatory = $true)]
-        [string]$Activity
-    )
-    
-    $percentComplete = [math]::Round(($Current / $Total) * 100)
-    $barLength = 50
-    $filledLength = [math]::Round(($percentComplete / 100) * $barLength)
-    $emptyLength = $barLength - $filledLength
-    
-    $bar = "█" * $filledLength + "░" * $emptyLength
-    
-    Write-Host "`r$Activity [$bar] $percentComplete% ($Current/$Total)" -NoNewline -ForegroundColor Cyan
-}
-
 #endregion
 
 #region Azure Connection and Context
@@ -352,8 +337,12 @@ function Get-TargetStorageAccounts {
                 $accounts = @(Get-AzStorageAccount -ResourceGroupName $ResourceGroupName -Name $StorageAccountName -ErrorAction Stop)
             }
             else {
-                $allAccounts = Get-AzStorageAccount
-                $accounts = @($allAccounts | Where-Object { $_.StorageAccountName -eq $StorageAccountName })
+                # Resolve the resource group through the ARM index instead of
+                # listing every account in the subscription and filtering here
+                $resources = @(Get-AzResource -ResourceType 'Microsoft.Storage/storageAccounts' -Name $StorageAccountName -ErrorAction SilentlyContinue)
+                $accounts = @($resources | ForEach-Object {
+                    Get-AzStorageAccount -ResourceGroupName $_.ResourceGroupName -Name $_.Name -ErrorAction Stop
+                })
             }
         }
         elseif ($ResourceGroupName) {
@@ -402,7 +391,11 @@ function Test-SecurityPosture {
     
     $findings = @()
     $secConfig = $Config.Security
-    
+
+    # Bind the nested property trees read by several checks once
+    $encryption = $StorageAccount.Encryption
+    $tags = $StorageAccount.Tags
+
     # Check public access
     if ($secConfig.CheckPublicAccess) {
         if ($StorageAccount.AllowBlobPublicAccess -eq $true) {
@@ -448,33 +441,25 @@ function Test-SecurityPosture {
     
     # Check Encryption at Rest
     if ($secConfig.CheckEncryption) {
-        if ($StorageAccount.Encryption.Services.Blob.Enabled -ne $true) {
-            $findings += [PSCustomObject]@{
-                Category = "Security"
-                Severity = "Critical"
-                Type = "Encryption at Rest"
-                Finding = "Blob encryption at rest is not enabled"
-                Recommendation = "Enable encryption at rest for all storage services"
-                Remediation = "Encryption should be enabled by default - investigate why it's disabled"
-            }
-        }
-        
-        if ($StorageAccount.Encryption.Services.File.Enabled -ne $true) {
-            $findings += [PSCustomObject]@{
-                Category = "Security"
-                Severity = "Critical"
-                Type = "Encryption at Rest"
-                Finding = "File service encryption at rest is not enabled"
-                Recommendation = "Enable encryption at rest for file services"
-                Remediation = "Encryption should be enabled by default - investigate why it's disabled"
+        # One table-driven sweep instead of a hand-rolled block per service
+        foreach ($service in @('Blob', 'File')) {
+            if ($encryption.Services.$service.Enabled -ne $true) {
+                $findings += [PSCustomObject]@{
+                    Category = "Security"
+                    Severity = "Critical"
+                    Type = "Encryption at Rest"
+                    Finding = "$service service encryption at rest is not enabled"
+                    Recommendation = "Enable encryption at rest for all storage services"
+                    Remediation = "Encryption should be enabled by default - investigate why it's disabled"
+                }
             }
         }
     }
     
     # Check Customer-Managed Keys (CMK)
     if ($secConfig.CheckEncryptionKeyManagement) {
-        if ($StorageAccount.Encryption.KeySource -eq 'Microsoft.Storage') {
-            $severity = if ($StorageAccount.Tags.DataClassification -in @('Confidential', 'Restricted')) { 'High' } else { 'Medium' }
+        if ($encryption.KeySource -eq 'Microsoft.Storage') {
+            $severity = if ($tags.DataClassification -in @('Confidential', 'Restricted')) { 'High' } else { 'Medium' }
             $findings += [PSCustomObject]@{
                 Category = "Security"
                 Severity = $severity
@@ -484,9 +469,9 @@ function Test-SecurityPosture {
                 Remediation = "Configure CMK via Azure Key Vault for sensitive data"
             }
         }
-        elseif ($StorageAccount.Encryption.KeySource -eq 'Microsoft.Keyvault') {
+        elseif ($encryption.KeySource -eq 'Microsoft.Keyvault') {
             # Verify key vault configuration
-            if (-not $StorageAccount.Encryption.KeyVaultProperties.KeyName) {
+            if (-not $encryption.KeyVaultProperties.KeyName) {
                 $findings += [PSCustomObject]@{
                     Category = "Security"
                     Severity = "High"
@@ -530,7 +515,7 @@ function Test-SecurityPosture {
     # Check private endpoints
     if ($secConfig.CheckPrivateEndpoints) {
         if (-not $StorageAccount.PrivateEndpointConnections -or $StorageAccount.PrivateEndpointConnections.Count -eq 0) {
-            $severity = if ($StorageAccount.Tags.Environment -eq 'Production') { 'High' } else { 'Medium' }
+            $severity = if ($tags.Environment -eq 'Production') { 'High' } else { 'Medium' }
             $findings += [PSCustomObject]@{
                 Category = "Security"
                 Severity = $severity
@@ -606,7 +591,9 @@ function Test-ResiliencyPosture {
     }
     
     # Check soft delete and versioning
-    if ($resConfig.CheckSoftDelete -or $resConfig.CheckVersioning) {
+    # FileStorage accounts have no blob service, so querying blob service
+    # properties would just burn an ARM call and log a warning
+    if (($resConfig.CheckSoftDelete -or $resConfig.CheckVersioning) -and $StorageAccount.Kind -ne 'FileStorage') {
         try {
             $blobServiceProperties = Get-AzStorageBlobServiceProperty -ResourceGroupName $StorageAccount.ResourceGroupName -StorageAccountName $StorageAccount.StorageAccountName -ErrorAction Stop
             
@@ -710,9 +697,15 @@ function Test-OperationalBestPractices {
     
     # Check naming conventions
     if ($opConfig.CheckNaming -and $opConfig.NamingPattern) {
+        # Compile the configured pattern once and reuse it across every
+        # account in the run instead of re-resolving it per -match
+        if ($null -eq $Script:NamingRegex -or $Script:NamingRegex.ToString() -ne $opConfig.NamingPattern) {
+            $Script:NamingRegex = [regex]::new($opConfig.NamingPattern, [System.Text.RegularExpressions.RegexOptions]::Compiled -bor [System.Text.RegularExpressions.RegexOptions]::IgnoreCase)
+        }
+
         $accountName = $StorageAccount.StorageAccountName
-        
-        if ($accountName -notmatch $opConfig.NamingPattern) {
+
+        if (-not $Script:NamingRegex.IsMatch($accountName)) {
             $findings += [PSCustomObject]@{
                 Category = "Operational"
                 Severity = "Low"
@@ -724,16 +717,21 @@ function Test-OperationalBestPractices {
         }
     }
     
-    # Check required tags
+    # Check required tags - collect missing and empty-valued tags in one pass
     if ($opConfig.CheckTags -and $opConfig.RequiredTags) {
+        $tags = $StorageAccount.Tags
         $missingTags = @()
-        
+        $emptyTags = @()
+
         foreach ($requiredTag in $opConfig.RequiredTags) {
-            if (-not $StorageAccount.Tags -or -not $StorageAccount.Tags.ContainsKey($requiredTag)) {
+            if (-not $tags -or -not $tags.ContainsKey($requiredTag)) {
                 $missingTags += $requiredTag
             }
+            elseif ([string]::IsNullOrWhiteSpace($tags[$requiredTag])) {
+                $emptyTags += $requiredTag
+            }
         }
-        
+
         if ($missingTags.Count -gt 0) {
             $findings += [PSCustomObject]@{
                 Category = "Operational"
@@ -744,6 +742,17 @@ function Test-OperationalBestPractices {
                 Remediation = "Implement Azure Policy to enforce required tags"
             }
         }
+
+        if ($emptyTags.Count -gt 0) {
+            $findings += [PSCustomObject]@{
+                Category = "Operational"
+                Severity = "Low"
+                Type = "Tagging"
+                Finding = "Required tags present but empty: $($emptyTags -join ', ')"
+                Recommendation = "Populate required tag values - empty tags defeat governance reporting"
+                Remediation = "Set meaningful values for the listed tags"
+            }
+        }
     }
     
     # Check managed identity
@@ -980,29 +989,41 @@ function Test-GovernanceControls {
             $roleAssignments = Get-AzRoleAssignment -Scope $StorageAccount.Id -ErrorAction SilentlyContinue
             
             if ($roleAssignments) {
+                # Bucket assignments in one pass instead of a Where-Object scan per check
+                $privilegedRoles = @('Owner', 'Contributor')
+                $ownerCount = 0
+                $privilegedUserCount = 0
+
+                foreach ($assignment in $roleAssignments) {
+                    if ($assignment.RoleDefinitionName -eq 'Owner') {
+                        $ownerCount++
+                    }
+                    if ($assignment.ObjectType -eq 'User' -and $assignment.RoleDefinitionName -in $privilegedRoles) {
+                        $privilegedUserCount++
+                    }
+                }
+
                 # Check for excessive Owner role assignments
-                $ownerAssignments = $roleAssignments | Where-Object { $_.RoleDefinitionName -eq 'Owner' }
                 $maxOwners = if ($govConfig.MaxOwnerRoleAssignments) { $govConfig.MaxOwnerRoleAssignments } else { 2 }
-                
-                if ($ownerAssignments.Count -gt $maxOwners) {
+
+                if ($ownerCount -gt $maxOwners) {
                     $findings += [PSCustomObject]@{
                         Category = "Governance"
                         Severity = "Medium"
                         Type = "Access Control"
-                        Finding = "$($ownerAssignments.Count) Owner role assignments detected (recommended maximum: $maxOwners)"
+                        Finding = "$ownerCount Owner role assignments detected (recommended maximum: $maxOwners)"
                         Recommendation = "Review and minimize Owner role assignments - apply principle of least privilege"
                         Remediation = "Use more specific roles like Storage Blob Data Contributor instead of Owner"
                     }
                 }
-                
+
                 # Check for user accounts vs service principals
-                $userAssignments = $roleAssignments | Where-Object { $_.ObjectType -eq 'User' -and $_.RoleDefinitionName -in @('Owner', 'Contributor') }
-                if ($userAssignments.Count -gt 3) {
+                if ($privilegedUserCount -gt 3) {
                     $findings += [PSCustomObject]@{
                         Category = "Governance"
                         Severity = "Low"
                         Type = "Access Control"
-                        Finding = "$($userAssignments.Count) individual user accounts have Owner/Contributor access"
+                        Finding = "$privilegedUserCount individual user accounts have Owner/Contributor access"
                         Recommendation = "Consider using groups or managed identities instead of individual user accounts"
                         Remediation = "Assign roles to Azure AD groups for easier management"
                     }
@@ -1073,43 +1094,48 @@ function Invoke-StorageAccountAssessment {
     Write-Host "`n  Assessing: " -NoNewline -ForegroundColor Gray
     Write-Host $StorageAccount.StorageAccountName -ForegroundColor White
     
-    $allFindings = @()
-    
-    # Security assessment
-    Write-Host "    • Security posture..." -ForegroundColor Gray
-    $securityFindings = Test-SecurityPosture -StorageAccount $StorageAccount -Config $Config
-    $allFindings += $securityFindings
-    
-    # Resiliency assessment
-    Write-Host "    • Resiliency & DR..." -ForegroundColor Gray
-    $resiliencyFindings = Test-ResiliencyPosture -StorageAccount $StorageAccount -Config $Config
-    $allFindings += $resiliencyFindings
-    
-    # Operational assessment
-    Write-Host "    • Operational practices..." -ForegroundColor Gray
-    $operationalFindings = Test-OperationalBestPractices -StorageAccount $StorageAccount -Config $Config
-    $allFindings += $operationalFindings
-    
-    # Lifecycle assessment
-    if (-not $Quick) {
-        Write-Host "    • Lifecycle management..." -ForegroundColor Gray
-        $lifecycleFindings = Test-LifecycleManagement -StorageAccount $StorageAccount -Config $Config
-        $allFindings += $lifecycleFindings
+    # Accumulate into a List - += on an array re-copies all prior findings,
+    # and appending an empty analyzer result would add a null entry
+    $allFindings = [System.Collections.Generic.List[object]]::new()
+
+    # Assessment dispatch table - adding a check is a data change here
+    # rather than another copy-pasted block; FullOnly steps are skipped
+    # under -Quick
+    $assessmentSteps = @(
+        @{ Label = 'Security posture';      Function = 'Test-SecurityPosture';          FullOnly = $false }
+        @{ Label = 'Resiliency & DR';       Function = 'Test-ResiliencyPosture';        FullOnly = $false }
+        @{ Label = 'Operational practices'; Function = 'Test-OperationalBestPractices'; FullOnly = $false }
+        @{ Label = 'Lifecycle management';  Function = 'Test-LifecycleManagement';      FullOnly = $true }
+        @{ Label = 'Governance controls';   Function = 'Test-GovernanceControls';       FullOnly = $true }
+    )
+
+    foreach ($step in $assessmentSteps) {
+        if ($Quick -and $step.FullOnly) {
+            continue
+        }
+
+        Write-Host "    • $($step.Label)..." -ForegroundColor Gray
+        $stepFindings = & $step.Function -StorageAccount $StorageAccount -Config $Config
+        if ($stepFindings) { $allFindings.AddRange(@($stepFindings)) }
     }
     
-    # Governance assessment
-    if (-not $Quick) {
-        Write-Host "    • Governance controls..." -ForegroundColor Gray
-        $governanceFindings = Test-GovernanceControls -StorageAccount $StorageAccount -Config $Config
-        $allFindings += $governanceFindings
+    # Calculate scores - tally severities in a single pass instead of one Where-Object scan per level
+    $criticalCount = 0
+    $highCount = 0
+    $mediumCount = 0
+    $lowCount = 0
+    $infoCount = 0
+
+    foreach ($finding in $allFindings) {
+        switch ($finding.Severity) {
+            'Critical' { $criticalCount++ }
+            'High' { $highCount++ }
+            'Medium' { $mediumCount++ }
+            'Low' { $lowCount++ }
+            'Info' { $infoCount++ }
+        }
     }
     
-    # Calculate scores
-    $criticalCount = ($allFindings | Where-Object { $_.Severity -eq 'Critical' }).Count
-    $highCount = ($allFindings | Where-Object { $_.Severity -eq 'High' }).Count
-    $mediumCount = ($allFindings | Where-Object { $_.Severity -eq 'Medium' }).Count
-    $lowCount = ($allFindings | Where-Object { $_.Severity -eq 'Low' }).Count
-    
     # Enhanced scoring with better weighting and minimum floor
     $score = 100 - ($criticalCount * 20) - ($highCount * 12) - ($mediumCount * 5) - ($lowCount * 2)
     $score = [math]::Max(10, [math]::Min(100, $score))  # Floor at 10, ceiling at 100
@@ -1150,7 +1176,7 @@ function Invoke-StorageAccountAssessment {
             High = $highCount
             Medium = $mediumCount
             Low = $lowCount
-            Info = ($allFindings | Where-Object { $_.Severity -eq 'Info' }).Count
+            Info = $infoCount
         }
     }
 }
@@ -1175,14 +1201,23 @@ function Export-AssessmentReport {
     if (-not (Test-Path $OutputPath)) {
         New-Item -Path $OutputPath -ItemType Directory -Force | Out-Null
     }
-    
-    $timestamp = Get-Date -Format "yyyyMMdd_HHmmss"
-    $reportPrefix = "StorageAssessment_$timestamp"
+
+    # Resolve to an absolute path: the WriteAllText calls below go through
+    # .NET, which resolves relative paths against the process working
+    # directory rather than the PowerShell location
+    $OutputPath = Convert-Path $OutputPath
+
+    # Reuse the run's assessment ID so report filenames match the metadata
+    # instead of drifting to whatever minute the reports happen to be written
+    $reportPrefix = "StorageAssessment_$($Script:AssessmentId)"
     
     # JSON Report
     try {
         $jsonPath = Join-Path $OutputPath "$reportPrefix.json"
-        $Results | ConvertTo-Json -Depth 10 | Out-File -FilePath $jsonPath -Encoding UTF8
+        $json = $Results | ConvertTo-Json -Depth 10
+        # Write the multi-MB JSON string in one call instead of pushing it
+        # line-by-line through the Out-File formatting pipeline
+        [System.IO.File]::WriteAllText($jsonPath, $json, [System.Text.UTF8Encoding]::new($false))
         Write-Status "JSON report: $jsonPath" -Type Success
     }
     catch {
@@ -1192,17 +1227,18 @@ function Export-AssessmentReport {
     # CSV Report (findings)
     try {
         $csvPath = Join-Path $OutputPath "$reportPrefix.csv"
-        $allFindings = $Results.StorageAccounts | ForEach-Object {
-            $account = $_.StorageAccount
-            $_.Findings | ForEach-Object {
+        # Flatten account findings with plain foreach loops - the nested
+        # ForEach-Object pipelines invoked a scriptblock per finding
+        $allFindings = foreach ($account in $Results.StorageAccounts) {
+            foreach ($finding in $account.Findings) {
                 [PSCustomObject]@{
-                    StorageAccount = $account
-                    Category = $_.Category
-                    Severity = $_.Severity
-                    Type = $_.Type
-                    Finding = $_.Finding
-                    Recommendation = $_.Recommendation
-                    Remediation = $_.Remediation
+                    StorageAccount = $account.StorageAccount
+                    Category = $finding.Category
+                    Severity = $finding.Severity
+                    Type = $finding.Type
+                    Finding = $finding.Finding
+                    Recommendation = $finding.Recommendation
+                    Remediation = $finding.Remediation
                 }
             }
         }
@@ -1217,7 +1253,7 @@ function Export-AssessmentReport {
     try {
         $htmlPath = Join-Path $OutputPath "$reportPrefix.html"
         $htmlContent = New-IndustrialPDFReport -Results $Results
-        $htmlContent | Out-File -FilePath $htmlPath -Encoding UTF8
+        [System.IO.File]::WriteAllText($htmlPath, $htmlContent, [System.Text.UTF8Encoding]::new($false))
         Write-Status "HTML report: $htmlPath" -Type Success
     }
     catch {
@@ -1231,9 +1267,12 @@ function Export-AssessmentReport {
                 Import-Module PSWriteHTML -ErrorAction Stop
                 $pdfPath = Join-Path $OutputPath "$reportPrefix.pdf"
                 
-                # Generate modern industrial-style PDF
-                $pdfHtml = New-IndustrialPDFReport -Results $Results
-                $pdfHtml | Out-File -FilePath $pdfPath.Replace('.pdf', '_temp.html') -Encoding UTF8
+                # Reuse the HTML already rendered above rather than running
+                # New-IndustrialPDFReport a second time over the same results
+                if (-not $htmlContent) {
+                    $htmlContent = New-IndustrialPDFReport -Results $Results
+                }
+                [System.IO.File]::WriteAllText($pdfPath.Replace('.pdf', '_temp.html'), $htmlContent, [System.Text.UTF8Encoding]::new($false))
                 
                 # Note: Actual PDF conversion requires wkhtmltopdf or similar tool
                 Write-Status "Industrial-style HTML generated for PDF conversion: $($pdfPath.Replace('.pdf', '_temp.html'))" -Type Success
@@ -1251,238 +1290,6 @@ function Export-AssessmentReport {
     return $htmlPath
 }
 
-function New-HTMLReport {
-    param($Results)
-    
-    $html = @"
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Azure Storage Assessment Report</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #0078d4;
-            border-bottom: 3px solid #0078d4;
-            padding-bottom: 10px;
-        }
-        h2 {
-            color: #333;
-            margin-top: 30px;
-        }
-        .header {
-            background: linear-gradient(135deg, #0078d4 0%, #00bcf2 100%);
-            color: white;
-            padding: 20px;
-            margin: -30px -30px 30px -30px;
-        }
-        .summary-box {
-            display: flex;
-            justify-content: space-around;
-            margin: 20px 0;
-            flex-wrap: wrap;
-        }
-        .summary-item {
-            background-color: #f8f8f8;
-            padding: 20px;
-            border-radius: 5px;
-            min-width: 200px;
-            margin: 10px;
-            text-align: center;
-        }
-        .summary-value {
-            font-size: 32px;
-            font-weight: bold;
-            color: #0078d4;
-        }
-        .summary-label {
-            color: #666;
-            margin-top: 5px;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }
-        th, td {
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }
-        th {
-            background-color: #0078d4;
-            color: white;
-        }
-        tr:hover {
-            background-color: #f5f5f5;
-        }
-        .severity-critical {
-            background-color: #d13438;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 3px;
-            font-weight: bold;
-        }
-        .severity-high {
-            background-color: #ff8c00;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 3px;
-            font-weight: bold;
-        }
-        .severity-medium {
-            background-color: #ffb900;
-            color: black;
-            padding: 4px 8px;
-            border-radius: 3px;
-            font-weight: bold;
-        }
-        .severity-low {
-            background-color: #00b7c3;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 3px;
-            font-weight: bold;
-        }
-        .severity-info {
-            background-color: #8a8886;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 3px;
-            font-weight: bold;
-        }
-        .footer {
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            color: #666;
-            font-size: 12px;
-            text-align: center;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Azure Storage Account Assessment Report</h1>
-            <p>Assessment ID: $($Results.Metadata.AssessmentId)</p>
-            <p>Generated: $($Results.Metadata.Timestamp)</p>
-            <p>Subscription: $($Results.Metadata.Subscription.Name)</p>
-        </div>
-        
-        <h2>Executive Summary</h2>
-        <div class="summary-box">
-            <div class="summary-item">
-                <div class="summary-value">$($Results.Summary.TotalAccounts)</div>
-                <div class="summary-label">Storage Accounts</div>
-            </div>
-            <div class="summary-item">
-                <div class="summary-value">$($Results.Summary.TotalFindings)</div>
-                <div class="summary-label">Total Findings</div>
-            </div>
-            <div class="summary-item">
-                <div class="summary-value">$($Results.Summary.CriticalFindings)</div>
-                <div class="summary-label">Critical</div>
-            </div>
-            <div class="summary-item">
-                <div class="summary-value">$($Results.Summary.HighFindings)</div>
-                <div class="summary-label">High</div>
-            </div>
-            <div class="summary-item">
-                <div class="summary-value">$($Results.Summary.MediumFindings)</div>
-                <div class="summary-label">Medium</div>
-            </div>
-        </div>
-        
-        <h2>Storage Accounts</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Storage Account</th>
-                    <th>Location</th>
-                    <th>SKU</th>
-                    <th>Score</th>
-                    <th>Findings</th>
-                </tr>
-            </thead>
-            <tbody>
-"@
-    
-    foreach ($account in $Results.StorageAccounts) {
-        $scoreColor = if ($account.Score -ge 80) { 'green' } elseif ($account.Score -ge 60) { 'orange' } else { 'red' }
-        $html += @"
-                <tr>
-                    <td><strong>$($account.StorageAccount)</strong></td>
-                    <td>$($account.Location)</td>
-                    <td>$($account.Sku)</td>
-                    <td style="color: $scoreColor; font-weight: bold;">$($account.Score)/100</td>
-                    <td>$($account.Summary.Total) ($($account.Summary.Critical)C / $($account.Summary.High)H / $($account.Summary.Medium)M / $($account.Summary.Low)L)</td>
-                </tr>
-"@
-    }
-    
-    $html += @"
-            </tbody>
-        </table>
-        
-        <h2>Detailed Findings</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Storage Account</th>
-                    <th>Severity</th>
-                    <th>Category</th>
-                    <th>Finding</th>
-                    <th>Recommendation</th>
-                </tr>
-            </thead>
-            <tbody>
-"@
-    
-    foreach ($account in $Results.StorageAccounts) {
-        foreach ($finding in $account.Findings) {
-            $html += @"
-                <tr>
-                    <td>$($account.StorageAccount)</td>
-                    <td><span class="severity-$($finding.Severity.ToLower())">$($finding.Severity)</span></td>
-                    <td>$($finding.Category)</td>
-                    <td>$($finding.Finding)</td>
-                    <td>$($finding.Recommendation)</td>
-                </tr>
-"@
-        }
-    }
-    
-    $html += @"
-            </tbody>
-        </table>
-        
-        <div class="footer">
-            <p>Generated by Azure Storage Best Practices Analyzer v$($Results.Metadata.Version)</p>
-            <p>Repository: <a href="$($Results.Metadata.Repository)">$($Results.Metadata.Repository)</a></p>
-        </div>
-    </div>
-</body>
-</html>
-"@
-    
-    return $html
-}
-
 function New-IndustrialPDFReport {
     param($Results)
     
@@ -1495,7 +1302,8 @@ function New-IndustrialPDFReport {
         [math]::Round(($Results.Summary.CriticalFindings / $totalAccounts), 1) 
     } else { 0 }
     
-    $html = @"
+    $sb = [System.Text.StringBuilder]::new()
+    [void]$sb.Append(@"
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -2026,11 +1834,11 @@ function New-IndustrialPDFReport {
         </div>
         
         <div class="account-grid">
-"@
+"@)
     
     foreach ($account in $Results.StorageAccounts) {
         $scoreClass = if ($account.Score -ge 80) { 'good' } elseif ($account.Score -ge 60) { 'warn' } else { 'critical' }
-        $html += @"
+        [void]$sb.Append(@"
             <div class="account-card">
                 <div class="account-header">
                     <div class="account-name">$($account.StorageAccount)</div>
@@ -2052,35 +1860,35 @@ function New-IndustrialPDFReport {
                         </div>
                     </div>
                     <div class="finding-summary">
-"@
+"@)
         if ($account.Summary.Critical -gt 0) {
-            $html += @"
+            [void]$sb.Append(@"
                         <div class="finding-badge critical">$($account.Summary.Critical) CRITICAL</div>
-"@
+"@)
         }
         if ($account.Summary.High -gt 0) {
-            $html += @"
+            [void]$sb.Append(@"
                         <div class="finding-badge high">$($account.Summary.High) HIGH</div>
-"@
+"@)
         }
         if ($account.Summary.Medium -gt 0) {
-            $html += @"
+            [void]$sb.Append(@"
                         <div class="finding-badge medium">$($account.Summary.Medium) MEDIUM</div>
-"@
+"@)
         }
         if ($account.Summary.Low -gt 0) {
-            $html += @"
+            [void]$sb.Append(@"
                         <div class="finding-badge low">$($account.Summary.Low) LOW</div>
-"@
+"@)
         }
-        $html += @"
+        [void]$sb.Append(@"
                     </div>
                 </div>
             </div>
-"@
+"@)
     }
     
-    $html += @"
+    [void]$sb.Append(@"
         </div>
         
         <!-- Detailed Findings Section -->
@@ -2099,23 +1907,27 @@ function New-IndustrialPDFReport {
                 </tr>
             </thead>
             <tbody>
-"@
+"@)
     
     foreach ($account in $Results.StorageAccounts) {
         foreach ($finding in $account.Findings) {
-            $html += @"
+            # Finding text includes free-form values (tag names, patterns from
+            # config) - encode so stray < > & cannot break the table markup
+            $findingText = [System.Net.WebUtility]::HtmlEncode($finding.Finding)
+            $recommendationText = [System.Net.WebUtility]::HtmlEncode($finding.Recommendation)
+            [void]$sb.Append(@"
                 <tr>
                     <td style="font-family: 'Roboto Mono', monospace; font-weight: 600;">$($account.StorageAccount)</td>
                     <td><span class="severity-badge $($finding.Severity.ToLower())">$($finding.Severity)</span></td>
                     <td style="color: #00ff88; font-weight: 600;">$($finding.Category)</td>
-                    <td>$($finding.Finding)</td>
-                    <td style="color: #b0b0b0;">$($finding.Recommendation)</td>
+                    <td>$findingText</td>
+                    <td style="color: #b0b0b0;">$recommendationText</td>
                 </tr>
-"@
+"@)
         }
     }
     
-    $html += @"
+    [void]$sb.Append(@"
             </tbody>
         </table>
         
@@ -2128,9 +1940,9 @@ function New-IndustrialPDFReport {
     </div>
 </body>
 </html>
-"@
+"@)
     
-    return $html
+    return $sb.ToString()
 }
 
 #endregion
@@ -2195,13 +2007,45 @@ try {
         }
         $Script:AssessmentResults.Summary.TotalAccounts += $storageAccounts.Count
         
-        $assessmentCounter = 0
-        foreach ($account in $storageAccounts) {
-            $assessmentCounter++
-            
-            $accountResult = Invoke-StorageAccountAssessment -StorageAccount $account -Config $config
-            $Script:AssessmentResults.StorageAccounts += $accountResult
-            
+        if ($ThrottleLimit -gt 1 -and $storageAccounts.Count -gt 1) {
+            # The per-account work is almost entirely I/O-bound Az calls, so fan it
+            # out across runspaces. Function definitions are rehydrated in each
+            # runspace because ForEach-Object -Parallel does not inherit them.
+            Write-Status "Assessing accounts in parallel (throttle limit: $ThrottleLimit)" -Type Info
+
+            $assessmentFunctions = @(
+                'Write-Status'
+                'Test-SecurityPosture'
+                'Test-ResiliencyPosture'
+                'Test-OperationalBestPractices'
+                'Test-LifecycleManagement'
+                'Test-GovernanceControls'
+                'Invoke-StorageAccountAssessment'
+            ) | ForEach-Object {
+                "function $_ {`n$((Get-Command -Name $_ -CommandType Function).Definition)`n}"
+            }
+            $assessmentFunctions = $assessmentFunctions -join "`n"
+
+            # Runspaces only inherit the Azure context when autosave is enabled,
+            # so pass the current context to every worker-side Az cmdlet explicitly
+            $azContext = Get-AzContext
+
+            $accountResults = @($storageAccounts | ForEach-Object -ThrottleLimit $ThrottleLimit -Parallel {
+                . ([scriptblock]::Create($using:assessmentFunctions))
+                $PSDefaultParameterValues = @{ '*-Az*:DefaultProfile' = $using:azContext }
+                $Quick = $using:Quick
+                Invoke-StorageAccountAssessment -StorageAccount $_ -Config $using:config
+            })
+        }
+        else {
+            $accountResults = @(foreach ($account in $storageAccounts) {
+                Invoke-StorageAccountAssessment -StorageAccount $account -Config $config
+            })
+        }
+
+        foreach ($accountResult in $accountResults) {
+            $Script:AssessmentResults.StorageAccounts.Add($accountResult)
+
             # Update summary
             $Script:AssessmentResults.Summary.TotalFindings += $accountResult.Summary.Total
             $Script:AssessmentResults.Summary.CriticalFindings += $accountResult.Summary.Critical